@@ -1,14 +1,20 @@
 """Pydantic models for API requests."""
 
-from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict
+from typing import Optional, Any
 
 class ChatCompletionRequest(BaseModel):
     """Request model for the /v1/chat/completions endpoint."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     model: str
-    messages: List[Dict[str, Any]] # Use List/Dict/Any for broader compatibility
+    messages: list[dict[str, Any]] # Any keeps message shapes open for multimodal/tool payloads
     stream: Optional[bool] = True
     # Add any other passthrough parameters your frontend might send
     # temperature: Optional[float] = None
     # max_tokens: Optional[int] = None
-    # ... other OpenAI compatible params
\ No newline at end of file
+    # ... other OpenAI compatible params
+
+    def upstream_body(self) -> bytes:
+        """Serialize the request for the upstream provider, forcing streaming on."""
+        return self.model_copy(update={"stream": True}).model_dump_json(exclude_unset=True).encode()
\ No newline at end of file